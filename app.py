@@ -7,76 +7,26 @@ and dithering algorithms with a 32MB file size limit.
 """
 
 import os
-import json
-from flask import Flask, render_template, request, jsonify, send_file, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory
+from werkzeug.exceptions import HTTPException
 from werkzeug.utils import secure_filename
-from PIL import Image, UnidentifiedImageError
-import io
-from dithering import (
-    floyd_steinberg_dither, ordered_dither, atkinson_dither, bayer_dither,
-    stucki_dither, jarvis_dither, burkes_dither,
-    sierra_dither, sierra_two_row_dither, sierra_lite_dither,
-    halftone_dither, blue_noise_dither
-)
-from palettes import get_palette, get_palette_list, PALETTES
-from color_dithering import (
-    floyd_steinberg_color_dither, ordered_color_dither,
-    atkinson_color_dither, bayer_color_dither,
-    stucki_color_dither, jarvis_color_dither, burkes_color_dither,
-    sierra_color_dither, sierra_two_row_color_dither, sierra_lite_color_dither,
-    halftone_color_dither, blue_noise_color_dither
-)
-
-# Algorithm mappings for cleaner routing
-BW_ALGORITHMS = {
-    'floyd-steinberg': floyd_steinberg_dither,
-    'ordered': ordered_dither,
-    'atkinson': atkinson_dither,
-    'bayer': bayer_dither,
-    'stucki': stucki_dither,
-    'jarvis': jarvis_dither,
-    'burkes': burkes_dither,
-    'sierra': sierra_dither,
-    'sierra-two-row': sierra_two_row_dither,
-    'sierra-lite': sierra_lite_dither,
-    'halftone': halftone_dither,
-    'blue-noise': blue_noise_dither
-}
-
-COLOR_ALGORITHMS = {
-    'floyd-steinberg': floyd_steinberg_color_dither,
-    'ordered': ordered_color_dither,
-    'atkinson': atkinson_color_dither,
-    'bayer': bayer_color_dither,
-    'stucki': stucki_color_dither,
-    'jarvis': jarvis_color_dither,
-    'burkes': burkes_color_dither,
-    'sierra': sierra_color_dither,
-    'sierra-two-row': sierra_two_row_color_dither,
-    'sierra-lite': sierra_lite_color_dither,
-    'halftone': halftone_color_dither,
-    'blue-noise': blue_noise_color_dither
-}
+from dispatch import warmup
+from utils import DisallowedImageError, parse_max_dimension, render_png
+from palettes import PALETTES, get_palette_list
 from api import api_bp
 
 app = Flask(__name__, static_folder='static')
 app.config['MAX_CONTENT_LENGTH'] = 32 * 1024 * 1024  # 32MB max upload size
-app.config['UPLOAD_FOLDER'] = '/tmp'
+# Behind nginx/Apache, let the proxy stream static files from disk instead of
+# reading them through a Python worker (send_from_directory emits X-Sendfile)
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE', '').lower() in ('1', 'true')
 app.register_blueprint(api_bp, url_prefix='/api')
 
-ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
-
-def allowed_file(filename):
-    """
-    Check if a filename has an allowed extension.
-
-    Args:
-        filename (str): The filename to check.
-
-    Returns:
-        bool: True if the file extension is in ALLOWED_EXTENSIONS, False otherwise.
-    """
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+# Prepare the dithering functions at boot rather than on each worker's first
+# request. WARMUP_PALETTES optionally lists built-in palette IDs whose lookup
+# tables should be built now too (comma-separated, or 'all').
+_warmup_palettes = os.environ.get('WARMUP_PALETTES', '')
+warmup(PALETTES if _warmup_palettes == 'all' else _warmup_palettes.split(','))
 
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
@@ -126,13 +76,17 @@ def dither_image():
             Options: 'bw' (default), 'gameboy', 'nes', 'c64', 'sepia', 'nord', etc.
         custom_palette (str, optional): JSON string of RGB color arrays for custom palette.
             Example: '[[255,0,0], [0,255,0], [0,0,255]]'
+        max_dimension (int, optional): If set, images larger than this on either
+            side are downscaled to fit before dithering. Dithering cost grows with
+            pixel count, so this is the recommended way to render fast previews.
 
     Returns:
         Response: PNG image file with dithered result, or JSON error message.
 
     Error Codes:
-        400: Missing file, invalid file type, or invalid algorithm.
-        500: Image processing error.
+        400: Missing file, invalid file type, invalid algorithm or palette,
+            unreadable image, or invalid parameters.
+        500: Unexpected server error.
 
     Example:
         curl -X POST -F "file=@photo.jpg" -F "algorithm=floyd-steinberg" -F "palette=gameboy" \\
@@ -145,52 +99,48 @@ def dither_image():
     if file.filename == '':
         return jsonify({'error': 'No selected file'}), 400
 
-    if not allowed_file(file.filename):
-        return jsonify({'error': 'File type not allowed'}), 400
-
+    algorithm = request.form.get('algorithm', 'floyd-steinberg')
     try:
-        algorithm = request.form.get('algorithm', 'floyd-steinberg')
-        palette_id = request.form.get('palette', 'bw')
-        custom_palette = request.form.get('custom_palette')
-
-        img = Image.open(file.stream).convert('RGB')  # Convert to RGB to ensure compatibility
-
-        # Get palette colors
-        if custom_palette:
-            palette = [tuple(c) for c in json.loads(custom_palette)]
-        else:
-            palette = get_palette(palette_id)
-
-        # Use color dithering if not B&W palette
-        use_color = palette_id != 'bw' or custom_palette
-
-        # Validate algorithm
-        if algorithm not in BW_ALGORITHMS:
-            return jsonify({'error': 'Invalid algorithm'}), 400
-
-        if use_color:
-            # Use color dithering functions
-            dither_func = COLOR_ALGORITHMS[algorithm]
-            dithered = dither_func(img, palette)
-        else:
-            # Use original B&W functions for backwards compatibility
-            dither_func = BW_ALGORITHMS[algorithm]
-            dithered = dither_func(img)
-
-        output = io.BytesIO()
-        dithered.save(output, format='PNG')
-        output.seek(0)
-        return send_file(
-            output,
-            mimetype='image/png',
-            as_attachment=True,
-            download_name=f'{algorithm}_{secure_filename(file.filename)}.png'
+        png = render_png(
+            file.stream.read(),
+            algorithm,
+            request.form.get('palette', 'bw'),
+            request.form.get('custom_palette'),
+            parse_max_dimension(request.form.get('max_dimension')),
         )
+    except DisallowedImageError:
+        return jsonify({'error': 'File type not allowed'}), 400
+    except ValueError as e:
+        # Bad form values or an unreadable image; the messages are client-safe
+        # (json.JSONDecodeError from a malformed custom_palette is a ValueError)
+        return jsonify({'error': str(e)}), 400
+
+    download_name = f'{algorithm}_{secure_filename(file.filename)}.png'
+    return Response(
+        png,
+        mimetype='image/png',
+        headers={'Content-Disposition': f'attachment; filename={download_name}'}
+    )
+
+@app.errorhandler(Exception)
+def handle_unexpected_error(e):
+    """
+    Return a generic JSON 500 for exceptions the handlers do not expect.
+
+    HTTP errors (404, 413, ...) are passed through unchanged. Anything else
+    is logged with its traceback; the response never echoes the exception
+    text back to the client.
 
-    except UnidentifiedImageError:
-        return jsonify({'error': 'Invalid or corrupted image file'}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    Args:
+        e (Exception): The unhandled exception.
+
+    Returns:
+        Response: JSON error message with status 500, or the HTTP error itself.
+    """
+    if isinstance(e, HTTPException):
+        return e
+    app.logger.exception('Unhandled error while processing request')
+    return jsonify({'error': 'Internal server error'}), 500
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True)
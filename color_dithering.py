@@ -6,9 +6,15 @@ arbitrary color palettes by finding the closest palette color for each pixel
 and diffusing the color error across RGB channels.
 """
 
+from functools import lru_cache
+
 import numpy as np
 from PIL import Image
 
+from dithering import BAYER_THRESHOLDS, ensure_mode, get_blue_noise_map
+from jit import HAVE_NUMBA, PARALLEL_LOCK, njit, prange
+from palettes import PALETTES
+
 
 def find_closest_color(pixel, palette):
     """
@@ -21,45 +27,437 @@ def find_closest_color(pixel, palette):
     Returns:
         RGB tuple of the closest palette color
     """
-    pixel = np.array(pixel)
-    palette = np.array(palette)
-    distances = np.sqrt(np.sum((palette - pixel) ** 2, axis=1))
+    # Integer squared distances have the same argmin, without floats or sqrt
+    pixel = np.asarray(pixel, dtype=np.int32)
+    palette = np.asarray(palette, dtype=np.int32)
+    diff = palette - pixel
+    distances = np.einsum('ij,ij->i', diff, diff)
     return tuple(palette[np.argmin(distances)])
 
 
-def floyd_steinberg_color_dither(image, palette):
+@njit(cache=True, fastmath=True)
+def _closest_index(r, g, b, palette):
+    """
+    Return the index of the palette color closest to an RGB value.
+
+    Same metric as find_closest_color (the channels are truncated to
+    integers first), computed in integer arithmetic with no sqrt or
+    temporary arrays inside the compiled dither loops. The error diffusion
+    kernels call it whenever _lut_index cannot answer.
+    """
+    r, g, b = int(r), int(g), int(b)
+    best = 0
+    best_distance = 1 << 62  # larger than any real distance
+    for i in range(palette.shape[0]):
+        dr = r - int(palette[i, 0])
+        dg = g - int(palette[i, 1])
+        db = b - int(palette[i, 2])
+        distance = dr * dr + dg * dg + db * db
+        if distance < best_distance:
+            best_distance = distance
+            best = i
+    return best
+
+
+# Bits dropped from each channel to address the palette lookup table
+_LUT_SHIFT = 3
+_LUT_SIZE = 256 >> _LUT_SHIFT
+
+
+def build_palette_lut(palette):
+    """
+    Build a (32, 32, 32) lookup table from quantized RGB to palette index.
+
+    Each entry covers an 8x8x8 block of RGB values. If the whole block is
+    strictly closer to one palette color than to any other, the entry holds
+    that color's index; otherwise it holds -1 and the caller must fall back
+    to a full search. The difference of two squared distances is linear in
+    the pixel, so checking the eight corners of a block is enough to prove
+    it lies inside one color's region. Lookups are therefore exact, not an
+    approximation of the nearest color.
+
+    Args:
+        palette (np.ndarray): (n, 3) array of palette colors.
+
+    Returns:
+        np.ndarray: int16 array of shape (32, 32, 32).
+    """
+    palette = np.asarray(palette, dtype=np.int64)
+    lo = np.arange(_LUT_SIZE) << _LUT_SHIFT
+    ends = np.stack([lo, lo + (1 << _LUT_SHIFT) - 1], axis=1)
+    # Channel values at the block corners, broadcasting to (32, 32, 32, 2, 2, 2)
+    r = ends[:, None, None, :, None, None]
+    g = ends[None, :, None, None, :, None]
+    b = ends[None, None, :, None, None, :]
+
+    def distances(color):
+        """Squared distance from every block corner to a color, (32, 32, 32, 8)."""
+        d = (r - color[0]) ** 2 + (g - color[1]) ** 2 + (b - color[2]) ** 2
+        return d.reshape(_LUT_SIZE, _LUT_SIZE, _LUT_SIZE, 8)
+
+    # Candidate owner of each block: the color nearest to its first corner
+    best = np.zeros((_LUT_SIZE,) * 3, dtype=np.int16)
+    best_distances = distances(palette[0])
+    for i in range(1, len(palette)):
+        d = distances(palette[i])
+        closer = d[..., 0] < best_distances[..., 0]
+        best[closer] = i
+        best_distances[closer] = d[closer]
+
+    # Keep the candidate only if it is strictly nearest at every corner
+    pure = np.ones(best.shape, dtype=bool)
+    for i in range(len(palette)):
+        pure &= (best == i) | (distances(palette[i]) > best_distances).all(axis=-1)
+
+    return np.where(pure, best, -1).astype(np.int16)
+
+
+@lru_cache(maxsize=32)
+def palette_lut(palette):
+    """
+    Build the lookup table for a palette once and cache it.
+
+    Args:
+        palette (tuple): Tuple of (r, g, b) integer tuples.
+
+    Returns:
+        np.ndarray: Read-only int16 array from build_palette_lut.
+    """
+    lut = build_palette_lut(np.array(palette))
+    lut.flags.writeable = False
+    return lut
+
+
+# Smallest palette that gets a lookup table; below this the linear search is faster
+_LUT_MIN_COLORS = 9
+
+# Passed in place of a lookup table to always use the linear search
+_NO_LUT = np.full((0, 0, 0), -1, dtype=np.int16)
+_NO_LUT.flags.writeable = False
+
+
+@njit(cache=True, fastmath=True)
+def _lut_index(r, g, b, lut):
+    """
+    Look up the palette index for an RGB value in a build_palette_lut table.
+
+    Returns -1 when the table cannot answer: the value's block is shared by
+    several colors, or the value was pushed outside 0-255 by accumulated
+    error. The kernels then call _closest_index, so the combined result
+    always matches _closest_index exactly.
+
+    The kernels skip this call entirely for _NO_LUT, and make the fallback
+    call themselves: a single helper taking both arrays and branching
+    between them is not inlined, and pays for reference counting on its
+    array arguments at every pixel.
+    """
+    ri, gi, bi = int(r), int(g), int(b)
+    i = -1
+    if 0 <= ri <= 255 and 0 <= gi <= 255 and 0 <= bi <= 255:
+        i = lut[ri >> _LUT_SHIFT, gi >> _LUT_SHIFT, bi >> _LUT_SHIFT]
+    return i
+
+
+def _palette_key(palette):
+    """Convert a palette to a tuple of (r, g, b) int tuples, the key for the cached helpers."""
+    return tuple(tuple(int(v) for v in color) for color in palette)
+
+
+_BUILTIN_PALETTE_KEYS = frozenset(_palette_key(colors) for colors in PALETTES.values())
+
+
+@lru_cache(maxsize=32)
+def sort_palette(palette):
+    """
+    Sort a palette from darkest to lightest, cached per palette.
+
+    The threshold and halftone dithers index into the palette by
+    luminance. Web requests reuse a handful of palettes, so the sort is
+    done once per palette rather than once per image.
+
+    Args:
+        palette (tuple): Tuple of (r, g, b) integer tuples.
+
+    Returns:
+        np.ndarray: Read-only (n, 3) uint8 array, darkest color first.
+    """
+    palette_sorted = np.array(sorted(palette, key=lambda c: 0.299*c[0] + 0.587*c[1] + 0.114*c[2]),
+                              dtype=np.uint8)
+    palette_sorted.flags.writeable = False
+    return palette_sorted
+
+
+def _lut_for(palette):
+    """
+    Pick the lookup table for an (n, 3) palette array.
+
+    Built-in palettes of 9 to 256 colors get a table, built once per
+    palette. Custom palettes come from clients, so they use _NO_LUT and
+    the linear search instead of a table per request. The results are the
+    same either way; only the speed differs.
+    """
+    if not _LUT_MIN_COLORS <= len(palette) <= 256:
+        return _NO_LUT
+    key = _palette_key(palette)
+    if key in _BUILTIN_PALETTE_KEYS:
+        return palette_lut(key)
+    return _NO_LUT
+
+
+def _to_planes(image):
+    """
+    Convert an image to a contiguous (3, h, w) uint8 array, one plane per channel.
+
+    The error diffusion kernels update each channel of several neighbors
+    per pixel; with separate planes those updates are unit-stride within a
+    channel instead of striding over interleaved RGB triples. The result is
+    always a fresh writable array: a read-only one (np.asarray of a 1-pixel
+    image is already contiguous) would make Numba compile a second
+    specialization of each kernel.
+    """
+    img = ensure_mode(image, 'RGB')
+    return np.array(np.asarray(img, dtype=np.uint8).transpose(2, 0, 1), order='C')
+
+
+def _index_buffer(shape, n_colors):
+    """Allocate an array for palette indices, uint8 unless the palette is larger than 256 colors."""
+    return np.empty(shape, dtype=np.uint8 if n_colors <= 256 else np.uint16)
+
+
+def _indexed_image(indices, palette):
+    """
+    Build an image from an (h, w) array of palette indices.
+
+    Palettes of up to 256 colors produce a paletted ('P') image carrying
+    the palette, which is a third of the size of RGB and lets the PNG
+    encoder write 1, 2, 4 or 8 bits per pixel. Larger palettes fall back
+    to expanding the indices to RGB.
+    """
+    palette = np.asarray(palette, dtype=np.uint8)
+    if len(palette) > 256:
+        return Image.fromarray(palette[indices])
+
+    # frombuffer wraps the index array without copying it
+    h, w = indices.shape
+    img = Image.frombuffer('P', (w, h), indices, 'raw', 'P', 0, 1)
+    img.putpalette(palette.tobytes())
+    return img
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _floyd_steinberg_kernel(arr, palette, lut, out, serpentine):
+    """Floyd-Steinberg error diffusion over (3, h, w) uint8 planes, writing palette indices to out."""
+    _, h, w = arr.shape
+    has_lut = lut.size > 0  # _NO_LUT is empty
+    # Pending error per channel for the current row and the row below it.
+    # Rows are recycled as the scan moves down, so the float working set
+    # stays at two image rows instead of float planes for the whole image.
+    # The 7/16 share for the next pixel in scan order is carried in right.
+    err = np.zeros((2, 3, w), dtype=np.float32)
+    right = np.zeros(3)
+
+    for y in range(h):
+        e0 = err[y % 2]
+        e1 = err[(y + 1) % 2]
+        e1[:] = 0.0
+        right[:] = 0.0
+        reverse = serpentine and y % 2 == 1
+        d = -1 if reverse else 1  # scan direction
+        for j in range(w):
+            x = w - 1 - j if reverse else j
+            # Rounded to float32 exactly as if they had been stored in e0
+            r = arr[0, y, x] + np.float32(e0[0, x] + right[0])
+            g = arr[1, y, x] + np.float32(e0[1, x] + right[1])
+            b = arr[2, y, x] + np.float32(e0[2, x] + right[2])
+            i = _lut_index(r, g, b, lut) if has_lut else -1
+            if i < 0:
+                i = _closest_index(r, g, b, palette)
+            out[y, x] = i
+            for c in range(3):
+                old_pixel = arr[c, y, x] + np.float32(e0[c, x] + right[c])
+                new_pixel = palette[i, c]
+                error = old_pixel - new_pixel
+
+                right[c] = error * 7 / 16
+                # Nothing to spread below (right is set either way)
+                if error == 0.0:
+                    continue
+                if y + 1 < h:
+                    if 0 <= x - d < w:
+                        e1[c, x - d] += error * 3 / 16
+                    e1[c, x] += error * 5 / 16
+                    if 0 <= x + d < w:
+                        e1[c, x + d] += error * 1 / 16
+
+
+def floyd_steinberg_color_dither(image, palette, serpentine=False):
     """
     Apply Floyd-Steinberg error diffusion dithering with a color palette.
 
     Args:
         image (PIL.Image): Input RGB image
-        palette (list): List of RGB tuples representing available colors
+        palette (list or np.ndarray): RGB tuples or an (n, 3) array of available colors
+        serpentine (bool): Scan alternate rows right to left (default: False).
 
     Returns:
-        PIL.Image: Dithered image using only palette colors
+        PIL.Image: Dithered image using only palette colors (mode 'P' for up to 256 colors)
+    """
+    arr = _to_planes(image)
+    palette = np.asarray(palette, dtype=np.float32)
+    out = _index_buffer(arr.shape[1:], len(palette))
+    _floyd_steinberg_kernel(arr, palette, _lut_for(palette), out, serpentine)
+
+    return _indexed_image(out, palette)
+
+
+@njit(parallel=True, cache=True)
+def _threshold_kernel(arr, threshold_map, n_colors, output):
+    """
+    Map each pixel to an index into a luminance-sorted palette using a tiled threshold map.
+
+    Shared by the ordered, Bayer and blue noise color dithers. The pixel's
+    luminance is offset by its threshold and scaled to a palette index.
+    Pixels are independent, so rows are spread across cores.
+
+    Args:
+        arr (np.ndarray): uint8 RGB array of shape (h, w, 3).
+        threshold_map (np.ndarray): Thresholds in [0, 1], tiled over the image.
+        n_colors (int): Number of palette colors, sorted darkest first.
+        output (np.ndarray): (h, w) array that receives the palette indices.
     """
-    img = image.convert('RGB')
-    arr = np.array(img, dtype=float)
     h, w, _ = arr.shape
+    map_h, map_w = threshold_map.shape
 
-    for y in range(h):
+    # Tile the map across the image width once (see dithering._threshold_kernel)
+    tiled = np.empty((map_h, w), dtype=threshold_map.dtype)
+    for ty in range(map_h):
         for x in range(w):
-            old_pixel = arr[y, x].copy()
-            new_pixel = np.array(find_closest_color(tuple(old_pixel.astype(int)), palette))
-            arr[y, x] = new_pixel
-            error = old_pixel - new_pixel
+            tiled[ty, x] = threshold_map[ty, x % map_w]
+
+    for y in prange(h):
+        row = tiled[y % map_h]
+        for x in range(w):
+            luminance = (0.299 * arr[y, x, 0] + 0.587 * arr[y, x, 1] + 0.114 * arr[y, x, 2]) / 255
+            threshold = row[x]
+
+            # Adjust luminance by threshold and map to palette index
+            adjusted = luminance + (threshold - 0.5) / n_colors
+            output[y, x] = int(min(max(adjusted * n_colors, 0), n_colors - 1))
+
+
+def _threshold_indices(arr, threshold_map, n_colors, output):
+    """
+    Vectorized NumPy equivalent of _threshold_kernel.
+
+    Used when Numba is not installed, where the per-pixel loop would run
+    in the interpreter. The threshold map is tiled to the image size once
+    and the whole image is mapped in a few array passes. Same arguments
+    and results as _threshold_kernel.
+    """
+    h, w, _ = arr.shape
+    map_h, map_w = threshold_map.shape
+    luminance = (0.299 * arr[..., 0] + 0.587 * arr[..., 1] + 0.114 * arr[..., 2]) / 255
+    thresholds = np.tile(threshold_map, (-(-h // map_h), -(-w // map_w)))[:h, :w]
+
+    adjusted = luminance + (thresholds - 0.5) / n_colors
+    output[:] = np.clip(adjusted * n_colors, 0, n_colors - 1)
+
+
+def _apply_threshold(arr, threshold_map, n_colors, output):
+    """Run _threshold_kernel when Numba is available, else _threshold_indices."""
+    if HAVE_NUMBA:
+        with PARALLEL_LOCK:
+            _threshold_kernel(arr, threshold_map, n_colors, output)
+    else:
+        _threshold_indices(arr, threshold_map, n_colors, output)
+
+
+@njit(parallel=True, cache=True)
+def _halftone_kernel(arr, n_colors, dot_size, output):
+    """
+    Draw one palette-colored halftone dot per dot_size x dot_size cell.
+
+    Writes indices into a luminance-sorted palette of n_colors to output.
+    Cells are independent, so rows of cells are spread across cores.
+    The background (and any partial edge cells) use the lightest color.
+    """
+    h, w, _ = arr.shape
+
+    # Initialize output with lightest color
+    output[:, :] = n_colors - 1
+
+    center = dot_size / 2
+    max_radius = dot_size / 2
+    cell_area = dot_size * dot_size
+
+    for cell_y in prange(h // dot_size):
+        y = cell_y * dot_size
+        for x in range(0, w - dot_size + 1, dot_size):
+            # Calculate average color in this cell
+            r = 0.0
+            g = 0.0
+            b = 0.0
+            for dy in range(dot_size):
+                for dx in range(dot_size):
+                    r += arr[y + dy, x + dx, 0]
+                    g += arr[y + dy, x + dx, 1]
+                    b += arr[y + dy, x + dx, 2]
+            avg_luminance = (0.299 * r + 0.587 * g + 0.114 * b) / cell_area / 255
+
+            # Calculate dot radius based on luminance (darker = larger)
+            radius = max_radius * (1 - avg_luminance)
+
+            # Find closest dark color for the dot
+            dark_idx = int(min(max((1 - avg_luminance) * n_colors, 0), n_colors - 1))
+
+            # Apply circular dot
+            for dy in range(dot_size):
+                for dx in range(dot_size):
+                    distance = np.sqrt((dx - center + 0.5) ** 2 +
+                                       (dy - center + 0.5) ** 2)
+                    if distance <= radius:
+                        output[y + dy, x + dx] = dark_idx
+
+
+def _halftone_indices(arr, n_colors, dot_size, output):
+    """
+    Vectorized NumPy equivalent of _halftone_kernel.
+
+    Used when Numba is not installed. The image is reshaped into
+    dot_size x dot_size cells so every cell's luminance, dot radius and
+    dot color are computed in a few array passes, and one broadcast
+    distance mask draws all the dots. Same arguments and results as
+    _halftone_kernel.
+    """
+    h, w, _ = arr.shape
+    rows, cols = h // dot_size, w // dot_size
+
+    output[:, :] = n_colors - 1
+
+    cells = arr[:rows * dot_size, :cols * dot_size].reshape(rows, dot_size, cols, dot_size, 3)
+    sums = cells.sum(axis=(1, 3), dtype=np.float64)
+    avg_luminance = (0.299 * sums[..., 0] + 0.587 * sums[..., 1] +
+                     0.114 * sums[..., 2]) / (dot_size * dot_size) / 255
+
+    radius = dot_size / 2 * (1 - avg_luminance)
+    dark_idx = np.clip((1 - avg_luminance) * n_colors, 0, n_colors - 1).astype(output.dtype)
+
+    # Distance of each pixel in a cell from the cell center, indexed [dy, dx]
+    offsets = np.arange(dot_size) - dot_size / 2 + 0.5
+    distance = np.sqrt(offsets[None, :] ** 2 + offsets[:, None] ** 2)
+
+    dots = distance[None, :, None, :] <= radius[:, None, :, None]
+    output[:rows * dot_size, :cols * dot_size] = np.where(
+        dots, dark_idx[:, None, :, None], n_colors - 1).reshape(rows * dot_size, cols * dot_size)
 
-            if x + 1 < w:
-                arr[y, x + 1] += error * 7 / 16
-            if y + 1 < h:
-                if x > 0:
-                    arr[y + 1, x - 1] += error * 3 / 16
-                arr[y + 1, x] += error * 5 / 16
-                if x + 1 < w:
-                    arr[y + 1, x + 1] += error * 1 / 16
 
-    arr = np.clip(arr, 0, 255).astype(np.uint8)
-    return Image.fromarray(arr)
+def _apply_halftone(arr, n_colors, dot_size, output):
+    """Run _halftone_kernel when Numba is available, else _halftone_indices."""
+    if HAVE_NUMBA:
+        with PARALLEL_LOCK:
+            _halftone_kernel(arr, n_colors, dot_size, output)
+    else:
+        _halftone_indices(arr, n_colors, dot_size, output)
 
 
 def ordered_color_dither(image, palette):
@@ -68,78 +466,92 @@ def ordered_color_dither(image, palette):
 
     Args:
         image (PIL.Image): Input RGB image
-        palette (list): List of RGB tuples representing available colors
+        palette (list or np.ndarray): RGB tuples or an (n, 3) array of available colors
 
     Returns:
-        PIL.Image: Dithered image using only palette colors
+        PIL.Image: Dithered image using only palette colors (mode 'P' for up to 256 colors)
     """
-    img = image.convert('RGB')
-    arr = np.array(img, dtype=float)
+    img = ensure_mode(image, 'RGB')
+    arr = np.asarray(img)
     h, w, _ = arr.shape
 
-    # Sort palette by luminance for ordered dithering
-    palette_sorted = sorted(palette, key=lambda c: 0.299*c[0] + 0.587*c[1] + 0.114*c[2])
-    n_colors = len(palette_sorted)
+    # Palette sorted by luminance for ordered dithering
+    palette_sorted = sort_palette(_palette_key(palette))
 
-    threshold_map = np.array([
-        [0, 8, 2, 10],
-        [12, 4, 14, 6],
-        [3, 11, 1, 9],
-        [15, 7, 13, 5]
-    ]) / 16
+    output = _index_buffer((h, w), len(palette_sorted))
+    _apply_threshold(arr, BAYER_THRESHOLDS, len(palette_sorted), output)
 
-    for y in range(h):
-        for x in range(w):
-            # Calculate luminance and add threshold offset
-            pixel = arr[y, x]
-            luminance = (0.299 * pixel[0] + 0.587 * pixel[1] + 0.114 * pixel[2]) / 255
-            threshold = threshold_map[y % 4, x % 4]
+    return _indexed_image(output, palette_sorted)
 
-            # Adjust luminance by threshold and map to palette index
-            adjusted = luminance + (threshold - 0.5) / n_colors
-            palette_idx = int(np.clip(adjusted * n_colors, 0, n_colors - 1))
-            arr[y, x] = palette_sorted[palette_idx]
 
-    return Image.fromarray(arr.astype(np.uint8))
+@njit(cache=True, fastmath=True, nogil=True)
+def _atkinson_kernel(arr, palette, lut, out, serpentine):
+    """
+    Atkinson error diffusion over (3, h, w) uint8 planes, writing palette indices to out.
 
+    With serpentine set, odd rows are scanned right to left with the
+    stencil mirrored (see dithering._atkinson_kernel).
+    """
+    _, h, w = arr.shape
+    has_lut = lut.size > 0  # _NO_LUT is empty
+    # Pending error per channel for the current row and the two below it
+    err = np.zeros((3, 3, w), dtype=np.float32)
 
-def atkinson_color_dither(image, palette):
+    for y in range(h):
+        e0 = err[y % 3]
+        e1 = err[(y + 1) % 3]
+        e2 = err[(y + 2) % 3]
+        e2[:] = 0.0
+        reverse = serpentine and y % 2 == 1
+        d = -1 if reverse else 1  # scan direction
+        for j in range(w):
+            x = w - 1 - j if reverse else j
+            r = arr[0, y, x] + e0[0, x]
+            g = arr[1, y, x] + e0[1, x]
+            b = arr[2, y, x] + e0[2, x]
+            i = _lut_index(r, g, b, lut) if has_lut else -1
+            if i < 0:
+                i = _closest_index(r, g, b, palette)
+            out[y, x] = i
+            for c in range(3):
+                old_pixel = arr[c, y, x] + e0[c, x]
+                new_pixel = palette[i, c]
+                error = (old_pixel - new_pixel) / 8  # Atkinson uses 1/8
+                if error == 0.0:
+                    continue
+
+                if 0 <= x + d < w:
+                    e0[c, x + d] += error
+                if 0 <= x + 2 * d < w:
+                    e0[c, x + 2 * d] += error
+                if y + 1 < h:
+                    e1[c, x] += error
+                    if 0 <= x + d < w:
+                        e1[c, x + d] += error
+                    if 0 <= x - d < w:
+                        e1[c, x - d] += error
+                if y + 2 < h:
+                    e2[c, x] += error
+
+
+def atkinson_color_dither(image, palette, serpentine=False):
     """
     Apply Atkinson error diffusion dithering with a color palette.
 
     Args:
         image (PIL.Image): Input RGB image
-        palette (list): List of RGB tuples representing available colors
+        palette (list or np.ndarray): RGB tuples or an (n, 3) array of available colors
+        serpentine (bool): Scan alternate rows right to left (default: False).
 
     Returns:
-        PIL.Image: Dithered image using only palette colors
+        PIL.Image: Dithered image using only palette colors (mode 'P' for up to 256 colors)
     """
-    img = image.convert('RGB')
-    arr = np.array(img, dtype=float)
-    h, w, _ = arr.shape
+    arr = _to_planes(image)
+    palette = np.asarray(palette, dtype=np.float32)
+    out = _index_buffer(arr.shape[1:], len(palette))
+    _atkinson_kernel(arr, palette, _lut_for(palette), out, serpentine)
 
-    for y in range(h):
-        for x in range(w):
-            old_pixel = arr[y, x].copy()
-            new_pixel = np.array(find_closest_color(tuple(old_pixel.astype(int)), palette))
-            arr[y, x] = new_pixel
-            error = (old_pixel - new_pixel) / 8  # Atkinson uses 1/8
-
-            if x + 1 < w:
-                arr[y, x + 1] += error
-            if x + 2 < w:
-                arr[y, x + 2] += error
-            if y + 1 < h:
-                arr[y + 1, x] += error
-                if x + 1 < w:
-                    arr[y + 1, x + 1] += error
-                if x - 1 >= 0:
-                    arr[y + 1, x - 1] += error
-            if y + 2 < h:
-                arr[y + 2, x] += error
-
-    arr = np.clip(arr, 0, 255).astype(np.uint8)
-    return Image.fromarray(arr)
+    return _indexed_image(out, palette)
 
 
 def bayer_color_dither(image, palette):
@@ -148,322 +560,457 @@ def bayer_color_dither(image, palette):
 
     Args:
         image (PIL.Image): Input RGB image
-        palette (list): List of RGB tuples representing available colors
+        palette (list or np.ndarray): RGB tuples or an (n, 3) array of available colors
 
     Returns:
-        PIL.Image: Dithered image using only palette colors
+        PIL.Image: Dithered image using only palette colors (mode 'P' for up to 256 colors)
     """
-    img = image.convert('RGB')
-    arr = np.array(img, dtype=float)
+    img = ensure_mode(image, 'RGB')
+    arr = np.asarray(img)
     h, w, _ = arr.shape
 
-    # Sort palette by luminance
-    palette_sorted = sorted(palette, key=lambda c: 0.299*c[0] + 0.587*c[1] + 0.114*c[2])
-    n_colors = len(palette_sorted)
-
-    bayer_matrix = np.array([
-        [0, 8, 2, 10],
-        [12, 4, 14, 6],
-        [3, 11, 1, 9],
-        [15, 7, 13, 5]
-    ]) / 16
+    # Palette sorted by luminance
+    palette_sorted = sort_palette(_palette_key(palette))
 
-    for y in range(h):
-        for x in range(w):
-            pixel = arr[y, x]
-            luminance = (0.299 * pixel[0] + 0.587 * pixel[1] + 0.114 * pixel[2]) / 255
-            threshold = bayer_matrix[y % 4, x % 4]
+    output = _index_buffer((h, w), len(palette_sorted))
+    _apply_threshold(arr, BAYER_THRESHOLDS, len(palette_sorted), output)
 
-            adjusted = luminance + (threshold - 0.5) / n_colors
-            palette_idx = int(np.clip(adjusted * n_colors, 0, n_colors - 1))
-            arr[y, x] = palette_sorted[palette_idx]
+    return _indexed_image(output, palette_sorted)
 
-    return Image.fromarray(arr.astype(np.uint8))
 
+@njit(cache=True, fastmath=True, nogil=True)
+def _stucki_kernel(arr, palette, lut, out, serpentine):
+    """Stucki error diffusion over (3, h, w) uint8 planes, writing palette indices to out."""
+    _, h, w = arr.shape
+    has_lut = lut.size > 0  # _NO_LUT is empty
+    err = np.zeros((3, 3, w), dtype=np.float32)
 
-def stucki_color_dither(image, palette):
+    for y in range(h):
+        e0 = err[y % 3]
+        e1 = err[(y + 1) % 3]
+        e2 = err[(y + 2) % 3]
+        e2[:] = 0.0
+        reverse = serpentine and y % 2 == 1
+        d = -1 if reverse else 1  # scan direction
+        for j in range(w):
+            x = w - 1 - j if reverse else j
+            r = arr[0, y, x] + e0[0, x]
+            g = arr[1, y, x] + e0[1, x]
+            b = arr[2, y, x] + e0[2, x]
+            i = _lut_index(r, g, b, lut) if has_lut else -1
+            if i < 0:
+                i = _closest_index(r, g, b, palette)
+            out[y, x] = i
+            for c in range(3):
+                old_pixel = arr[c, y, x] + e0[c, x]
+                new_pixel = palette[i, c]
+                error = old_pixel - new_pixel
+                if error == 0.0:
+                    continue
+
+                # Row 0 (current row)
+                if 0 <= x + d < w:
+                    e0[c, x + d] += error * 8 / 42
+                if 0 <= x + 2 * d < w:
+                    e0[c, x + 2 * d] += error * 4 / 42
+
+                # Row 1
+                if y + 1 < h:
+                    if 0 <= x - 2 * d < w:
+                        e1[c, x - 2 * d] += error * 2 / 42
+                    if 0 <= x - d < w:
+                        e1[c, x - d] += error * 4 / 42
+                    e1[c, x] += error * 8 / 42
+                    if 0 <= x + d < w:
+                        e1[c, x + d] += error * 4 / 42
+                    if 0 <= x + 2 * d < w:
+                        e1[c, x + 2 * d] += error * 2 / 42
+
+                # Row 2
+                if y + 2 < h:
+                    if 0 <= x - 2 * d < w:
+                        e2[c, x - 2 * d] += error * 1 / 42
+                    if 0 <= x - d < w:
+                        e2[c, x - d] += error * 2 / 42
+                    e2[c, x] += error * 4 / 42
+                    if 0 <= x + d < w:
+                        e2[c, x + d] += error * 2 / 42
+                    if 0 <= x + 2 * d < w:
+                        e2[c, x + 2 * d] += error * 1 / 42
+
+
+def stucki_color_dither(image, palette, serpentine=False):
     """
     Apply Stucki error diffusion dithering with a color palette.
 
     Args:
         image (PIL.Image): Input RGB image
-        palette (list): List of RGB tuples representing available colors
+        palette (list or np.ndarray): RGB tuples or an (n, 3) array of available colors
+        serpentine (bool): Scan alternate rows right to left (default: False).
 
     Returns:
-        PIL.Image: Dithered image using only palette colors
+        PIL.Image: Dithered image using only palette colors (mode 'P' for up to 256 colors)
     """
-    img = image.convert('RGB')
-    arr = np.array(img, dtype=float)
-    h, w, _ = arr.shape
+    arr = _to_planes(image)
+    palette = np.asarray(palette, dtype=np.float32)
+    out = _index_buffer(arr.shape[1:], len(palette))
+    _stucki_kernel(arr, palette, _lut_for(palette), out, serpentine)
+
+    return _indexed_image(out, palette)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _jarvis_kernel(arr, palette, lut, out, serpentine):
+    """Jarvis-Judice-Ninke error diffusion over (3, h, w) uint8 planes, writing palette indices to out."""
+    _, h, w = arr.shape
+    has_lut = lut.size > 0  # _NO_LUT is empty
+    err = np.zeros((3, 3, w), dtype=np.float32)
 
     for y in range(h):
-        for x in range(w):
-            old_pixel = arr[y, x].copy()
-            new_pixel = np.array(find_closest_color(tuple(old_pixel.astype(int)), palette))
-            arr[y, x] = new_pixel
-            error = old_pixel - new_pixel
-
-            # Row 0 (current row)
-            if x + 1 < w:
-                arr[y, x + 1] += error * 8 / 42
-            if x + 2 < w:
-                arr[y, x + 2] += error * 4 / 42
-
-            # Row 1
-            if y + 1 < h:
-                if x - 2 >= 0:
-                    arr[y + 1, x - 2] += error * 2 / 42
-                if x - 1 >= 0:
-                    arr[y + 1, x - 1] += error * 4 / 42
-                arr[y + 1, x] += error * 8 / 42
-                if x + 1 < w:
-                    arr[y + 1, x + 1] += error * 4 / 42
-                if x + 2 < w:
-                    arr[y + 1, x + 2] += error * 2 / 42
-
-            # Row 2
-            if y + 2 < h:
-                if x - 2 >= 0:
-                    arr[y + 2, x - 2] += error * 1 / 42
-                if x - 1 >= 0:
-                    arr[y + 2, x - 1] += error * 2 / 42
-                arr[y + 2, x] += error * 4 / 42
-                if x + 1 < w:
-                    arr[y + 2, x + 1] += error * 2 / 42
-                if x + 2 < w:
-                    arr[y + 2, x + 2] += error * 1 / 42
-
-    arr = np.clip(arr, 0, 255).astype(np.uint8)
-    return Image.fromarray(arr)
-
-
-def jarvis_color_dither(image, palette):
+        e0 = err[y % 3]
+        e1 = err[(y + 1) % 3]
+        e2 = err[(y + 2) % 3]
+        e2[:] = 0.0
+        reverse = serpentine and y % 2 == 1
+        d = -1 if reverse else 1  # scan direction
+        for j in range(w):
+            x = w - 1 - j if reverse else j
+            r = arr[0, y, x] + e0[0, x]
+            g = arr[1, y, x] + e0[1, x]
+            b = arr[2, y, x] + e0[2, x]
+            i = _lut_index(r, g, b, lut) if has_lut else -1
+            if i < 0:
+                i = _closest_index(r, g, b, palette)
+            out[y, x] = i
+            for c in range(3):
+                old_pixel = arr[c, y, x] + e0[c, x]
+                new_pixel = palette[i, c]
+                error = old_pixel - new_pixel
+                if error == 0.0:
+                    continue
+
+                # Row 0
+                if 0 <= x + d < w:
+                    e0[c, x + d] += error * 7 / 48
+                if 0 <= x + 2 * d < w:
+                    e0[c, x + 2 * d] += error * 5 / 48
+
+                # Row 1
+                if y + 1 < h:
+                    if 0 <= x - 2 * d < w:
+                        e1[c, x - 2 * d] += error * 3 / 48
+                    if 0 <= x - d < w:
+                        e1[c, x - d] += error * 5 / 48
+                    e1[c, x] += error * 7 / 48
+                    if 0 <= x + d < w:
+                        e1[c, x + d] += error * 5 / 48
+                    if 0 <= x + 2 * d < w:
+                        e1[c, x + 2 * d] += error * 3 / 48
+
+                # Row 2
+                if y + 2 < h:
+                    if 0 <= x - 2 * d < w:
+                        e2[c, x - 2 * d] += error * 1 / 48
+                    if 0 <= x - d < w:
+                        e2[c, x - d] += error * 3 / 48
+                    e2[c, x] += error * 5 / 48
+                    if 0 <= x + d < w:
+                        e2[c, x + d] += error * 3 / 48
+                    if 0 <= x + 2 * d < w:
+                        e2[c, x + 2 * d] += error * 1 / 48
+
+
+def jarvis_color_dither(image, palette, serpentine=False):
     """
     Apply Jarvis-Judice-Ninke error diffusion dithering with a color palette.
 
     Args:
         image (PIL.Image): Input RGB image
-        palette (list): List of RGB tuples representing available colors
+        palette (list or np.ndarray): RGB tuples or an (n, 3) array of available colors
+        serpentine (bool): Scan alternate rows right to left (default: False).
 
     Returns:
-        PIL.Image: Dithered image using only palette colors
+        PIL.Image: Dithered image using only palette colors (mode 'P' for up to 256 colors)
     """
-    img = image.convert('RGB')
-    arr = np.array(img, dtype=float)
-    h, w, _ = arr.shape
+    arr = _to_planes(image)
+    palette = np.asarray(palette, dtype=np.float32)
+    out = _index_buffer(arr.shape[1:], len(palette))
+    _jarvis_kernel(arr, palette, _lut_for(palette), out, serpentine)
+
+    return _indexed_image(out, palette)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _burkes_kernel(arr, palette, lut, out, serpentine):
+    """Burkes error diffusion over (3, h, w) uint8 planes, writing palette indices to out."""
+    _, h, w = arr.shape
+    has_lut = lut.size > 0  # _NO_LUT is empty
+    err = np.zeros((3, 3, w), dtype=np.float32)
 
     for y in range(h):
-        for x in range(w):
-            old_pixel = arr[y, x].copy()
-            new_pixel = np.array(find_closest_color(tuple(old_pixel.astype(int)), palette))
-            arr[y, x] = new_pixel
-            error = old_pixel - new_pixel
-
-            # Row 0
-            if x + 1 < w:
-                arr[y, x + 1] += error * 7 / 48
-            if x + 2 < w:
-                arr[y, x + 2] += error * 5 / 48
-
-            # Row 1
-            if y + 1 < h:
-                if x - 2 >= 0:
-                    arr[y + 1, x - 2] += error * 3 / 48
-                if x - 1 >= 0:
-                    arr[y + 1, x - 1] += error * 5 / 48
-                arr[y + 1, x] += error * 7 / 48
-                if x + 1 < w:
-                    arr[y + 1, x + 1] += error * 5 / 48
-                if x + 2 < w:
-                    arr[y + 1, x + 2] += error * 3 / 48
-
-            # Row 2
-            if y + 2 < h:
-                if x - 2 >= 0:
-                    arr[y + 2, x - 2] += error * 1 / 48
-                if x - 1 >= 0:
-                    arr[y + 2, x - 1] += error * 3 / 48
-                arr[y + 2, x] += error * 5 / 48
-                if x + 1 < w:
-                    arr[y + 2, x + 1] += error * 3 / 48
-                if x + 2 < w:
-                    arr[y + 2, x + 2] += error * 1 / 48
-
-    arr = np.clip(arr, 0, 255).astype(np.uint8)
-    return Image.fromarray(arr)
-
-
-def burkes_color_dither(image, palette):
+        e0 = err[y % 3]
+        e1 = err[(y + 1) % 3]
+        e2 = err[(y + 2) % 3]
+        e2[:] = 0.0
+        reverse = serpentine and y % 2 == 1
+        d = -1 if reverse else 1  # scan direction
+        for j in range(w):
+            x = w - 1 - j if reverse else j
+            r = arr[0, y, x] + e0[0, x]
+            g = arr[1, y, x] + e0[1, x]
+            b = arr[2, y, x] + e0[2, x]
+            i = _lut_index(r, g, b, lut) if has_lut else -1
+            if i < 0:
+                i = _closest_index(r, g, b, palette)
+            out[y, x] = i
+            for c in range(3):
+                old_pixel = arr[c, y, x] + e0[c, x]
+                new_pixel = palette[i, c]
+                error = old_pixel - new_pixel
+                if error == 0.0:
+                    continue
+
+                # Row 0
+                if 0 <= x + d < w:
+                    e0[c, x + d] += error * 8 / 32
+                if 0 <= x + 2 * d < w:
+                    e0[c, x + 2 * d] += error * 4 / 32
+
+                # Row 1
+                if y + 1 < h:
+                    if 0 <= x - 2 * d < w:
+                        e1[c, x - 2 * d] += error * 2 / 32
+                    if 0 <= x - d < w:
+                        e1[c, x - d] += error * 4 / 32
+                    e1[c, x] += error * 8 / 32
+                    if 0 <= x + d < w:
+                        e1[c, x + d] += error * 4 / 32
+                    if 0 <= x + 2 * d < w:
+                        e1[c, x + 2 * d] += error * 2 / 32
+
+
+def burkes_color_dither(image, palette, serpentine=False):
     """
     Apply Burkes error diffusion dithering with a color palette.
 
     Args:
         image (PIL.Image): Input RGB image
-        palette (list): List of RGB tuples representing available colors
+        palette (list or np.ndarray): RGB tuples or an (n, 3) array of available colors
+        serpentine (bool): Scan alternate rows right to left (default: False).
 
     Returns:
-        PIL.Image: Dithered image using only palette colors
+        PIL.Image: Dithered image using only palette colors (mode 'P' for up to 256 colors)
     """
-    img = image.convert('RGB')
-    arr = np.array(img, dtype=float)
-    h, w, _ = arr.shape
+    arr = _to_planes(image)
+    palette = np.asarray(palette, dtype=np.float32)
+    out = _index_buffer(arr.shape[1:], len(palette))
+    _burkes_kernel(arr, palette, _lut_for(palette), out, serpentine)
+
+    return _indexed_image(out, palette)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _sierra_kernel(arr, palette, lut, out, serpentine):
+    """Sierra (3-row) error diffusion over (3, h, w) uint8 planes, writing palette indices to out."""
+    _, h, w = arr.shape
+    has_lut = lut.size > 0  # _NO_LUT is empty
+    err = np.zeros((3, 3, w), dtype=np.float32)
 
     for y in range(h):
-        for x in range(w):
-            old_pixel = arr[y, x].copy()
-            new_pixel = np.array(find_closest_color(tuple(old_pixel.astype(int)), palette))
-            arr[y, x] = new_pixel
-            error = old_pixel - new_pixel
-
-            # Row 0
-            if x + 1 < w:
-                arr[y, x + 1] += error * 8 / 32
-            if x + 2 < w:
-                arr[y, x + 2] += error * 4 / 32
-
-            # Row 1
-            if y + 1 < h:
-                if x - 2 >= 0:
-                    arr[y + 1, x - 2] += error * 2 / 32
-                if x - 1 >= 0:
-                    arr[y + 1, x - 1] += error * 4 / 32
-                arr[y + 1, x] += error * 8 / 32
-                if x + 1 < w:
-                    arr[y + 1, x + 1] += error * 4 / 32
-                if x + 2 < w:
-                    arr[y + 1, x + 2] += error * 2 / 32
-
-    arr = np.clip(arr, 0, 255).astype(np.uint8)
-    return Image.fromarray(arr)
-
-
-def sierra_color_dither(image, palette):
+        e0 = err[y % 3]
+        e1 = err[(y + 1) % 3]
+        e2 = err[(y + 2) % 3]
+        e2[:] = 0.0
+        reverse = serpentine and y % 2 == 1
+        d = -1 if reverse else 1  # scan direction
+        for j in range(w):
+            x = w - 1 - j if reverse else j
+            r = arr[0, y, x] + e0[0, x]
+            g = arr[1, y, x] + e0[1, x]
+            b = arr[2, y, x] + e0[2, x]
+            i = _lut_index(r, g, b, lut) if has_lut else -1
+            if i < 0:
+                i = _closest_index(r, g, b, palette)
+            out[y, x] = i
+            for c in range(3):
+                old_pixel = arr[c, y, x] + e0[c, x]
+                new_pixel = palette[i, c]
+                error = old_pixel - new_pixel
+                if error == 0.0:
+                    continue
+
+                # Row 0
+                if 0 <= x + d < w:
+                    e0[c, x + d] += error * 5 / 32
+                if 0 <= x + 2 * d < w:
+                    e0[c, x + 2 * d] += error * 3 / 32
+
+                # Row 1
+                if y + 1 < h:
+                    if 0 <= x - 2 * d < w:
+                        e1[c, x - 2 * d] += error * 2 / 32
+                    if 0 <= x - d < w:
+                        e1[c, x - d] += error * 4 / 32
+                    e1[c, x] += error * 5 / 32
+                    if 0 <= x + d < w:
+                        e1[c, x + d] += error * 4 / 32
+                    if 0 <= x + 2 * d < w:
+                        e1[c, x + 2 * d] += error * 2 / 32
+
+                # Row 2
+                if y + 2 < h:
+                    if 0 <= x - d < w:
+                        e2[c, x - d] += error * 2 / 32
+                    e2[c, x] += error * 3 / 32
+                    if 0 <= x + d < w:
+                        e2[c, x + d] += error * 2 / 32
+
+
+def sierra_color_dither(image, palette, serpentine=False):
     """
     Apply Sierra (3-row) error diffusion dithering with a color palette.
 
     Args:
         image (PIL.Image): Input RGB image
-        palette (list): List of RGB tuples representing available colors
+        palette (list or np.ndarray): RGB tuples or an (n, 3) array of available colors
+        serpentine (bool): Scan alternate rows right to left (default: False).
 
     Returns:
-        PIL.Image: Dithered image using only palette colors
+        PIL.Image: Dithered image using only palette colors (mode 'P' for up to 256 colors)
     """
-    img = image.convert('RGB')
-    arr = np.array(img, dtype=float)
-    h, w, _ = arr.shape
+    arr = _to_planes(image)
+    palette = np.asarray(palette, dtype=np.float32)
+    out = _index_buffer(arr.shape[1:], len(palette))
+    _sierra_kernel(arr, palette, _lut_for(palette), out, serpentine)
+
+    return _indexed_image(out, palette)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _sierra_two_row_kernel(arr, palette, lut, out, serpentine):
+    """Sierra Two-Row error diffusion over (3, h, w) uint8 planes, writing palette indices to out."""
+    _, h, w = arr.shape
+    has_lut = lut.size > 0  # _NO_LUT is empty
+    err = np.zeros((3, 3, w), dtype=np.float32)
 
     for y in range(h):
-        for x in range(w):
-            old_pixel = arr[y, x].copy()
-            new_pixel = np.array(find_closest_color(tuple(old_pixel.astype(int)), palette))
-            arr[y, x] = new_pixel
-            error = old_pixel - new_pixel
-
-            # Row 0
-            if x + 1 < w:
-                arr[y, x + 1] += error * 5 / 32
-            if x + 2 < w:
-                arr[y, x + 2] += error * 3 / 32
-
-            # Row 1
-            if y + 1 < h:
-                if x - 2 >= 0:
-                    arr[y + 1, x - 2] += error * 2 / 32
-                if x - 1 >= 0:
-                    arr[y + 1, x - 1] += error * 4 / 32
-                arr[y + 1, x] += error * 5 / 32
-                if x + 1 < w:
-                    arr[y + 1, x + 1] += error * 4 / 32
-                if x + 2 < w:
-                    arr[y + 1, x + 2] += error * 2 / 32
-
-            # Row 2
-            if y + 2 < h:
-                if x - 1 >= 0:
-                    arr[y + 2, x - 1] += error * 2 / 32
-                arr[y + 2, x] += error * 3 / 32
-                if x + 1 < w:
-                    arr[y + 2, x + 1] += error * 2 / 32
-
-    arr = np.clip(arr, 0, 255).astype(np.uint8)
-    return Image.fromarray(arr)
-
-
-def sierra_two_row_color_dither(image, palette):
+        e0 = err[y % 3]
+        e1 = err[(y + 1) % 3]
+        e2 = err[(y + 2) % 3]
+        e2[:] = 0.0
+        reverse = serpentine and y % 2 == 1
+        d = -1 if reverse else 1  # scan direction
+        for j in range(w):
+            x = w - 1 - j if reverse else j
+            r = arr[0, y, x] + e0[0, x]
+            g = arr[1, y, x] + e0[1, x]
+            b = arr[2, y, x] + e0[2, x]
+            i = _lut_index(r, g, b, lut) if has_lut else -1
+            if i < 0:
+                i = _closest_index(r, g, b, palette)
+            out[y, x] = i
+            for c in range(3):
+                old_pixel = arr[c, y, x] + e0[c, x]
+                new_pixel = palette[i, c]
+                error = old_pixel - new_pixel
+                if error == 0.0:
+                    continue
+
+                # Row 0
+                if 0 <= x + d < w:
+                    e0[c, x + d] += error * 4 / 16
+                if 0 <= x + 2 * d < w:
+                    e0[c, x + 2 * d] += error * 3 / 16
+
+                # Row 1
+                if y + 1 < h:
+                    if 0 <= x - 2 * d < w:
+                        e1[c, x - 2 * d] += error * 1 / 16
+                    if 0 <= x - d < w:
+                        e1[c, x - d] += error * 2 / 16
+                    e1[c, x] += error * 3 / 16
+                    if 0 <= x + d < w:
+                        e1[c, x + d] += error * 2 / 16
+                    if 0 <= x + 2 * d < w:
+                        e1[c, x + 2 * d] += error * 1 / 16
+
+
+def sierra_two_row_color_dither(image, palette, serpentine=False):
     """
     Apply Sierra Two-Row error diffusion dithering with a color palette.
 
     Args:
         image (PIL.Image): Input RGB image
-        palette (list): List of RGB tuples representing available colors
+        palette (list or np.ndarray): RGB tuples or an (n, 3) array of available colors
+        serpentine (bool): Scan alternate rows right to left (default: False).
 
     Returns:
-        PIL.Image: Dithered image using only palette colors
+        PIL.Image: Dithered image using only palette colors (mode 'P' for up to 256 colors)
     """
-    img = image.convert('RGB')
-    arr = np.array(img, dtype=float)
-    h, w, _ = arr.shape
+    arr = _to_planes(image)
+    palette = np.asarray(palette, dtype=np.float32)
+    out = _index_buffer(arr.shape[1:], len(palette))
+    _sierra_two_row_kernel(arr, palette, _lut_for(palette), out, serpentine)
+
+    return _indexed_image(out, palette)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _sierra_lite_kernel(arr, palette, lut, out, serpentine):
+    """Sierra Lite error diffusion over (3, h, w) uint8 planes, writing palette indices to out."""
+    _, h, w = arr.shape
+    has_lut = lut.size > 0  # _NO_LUT is empty
+    err = np.zeros((3, 3, w), dtype=np.float32)
 
     for y in range(h):
-        for x in range(w):
-            old_pixel = arr[y, x].copy()
-            new_pixel = np.array(find_closest_color(tuple(old_pixel.astype(int)), palette))
-            arr[y, x] = new_pixel
-            error = old_pixel - new_pixel
-
-            # Row 0
-            if x + 1 < w:
-                arr[y, x + 1] += error * 4 / 16
-            if x + 2 < w:
-                arr[y, x + 2] += error * 3 / 16
-
-            # Row 1
-            if y + 1 < h:
-                if x - 2 >= 0:
-                    arr[y + 1, x - 2] += error * 1 / 16
-                if x - 1 >= 0:
-                    arr[y + 1, x - 1] += error * 2 / 16
-                arr[y + 1, x] += error * 3 / 16
-                if x + 1 < w:
-                    arr[y + 1, x + 1] += error * 2 / 16
-                if x + 2 < w:
-                    arr[y + 1, x + 2] += error * 1 / 16
-
-    arr = np.clip(arr, 0, 255).astype(np.uint8)
-    return Image.fromarray(arr)
-
-
-def sierra_lite_color_dither(image, palette):
+        e0 = err[y % 3]
+        e1 = err[(y + 1) % 3]
+        e2 = err[(y + 2) % 3]
+        e2[:] = 0.0
+        reverse = serpentine and y % 2 == 1
+        d = -1 if reverse else 1  # scan direction
+        for j in range(w):
+            x = w - 1 - j if reverse else j
+            r = arr[0, y, x] + e0[0, x]
+            g = arr[1, y, x] + e0[1, x]
+            b = arr[2, y, x] + e0[2, x]
+            i = _lut_index(r, g, b, lut) if has_lut else -1
+            if i < 0:
+                i = _closest_index(r, g, b, palette)
+            out[y, x] = i
+            for c in range(3):
+                old_pixel = arr[c, y, x] + e0[c, x]
+                new_pixel = palette[i, c]
+                error = old_pixel - new_pixel
+                if error == 0.0:
+                    continue
+
+                if 0 <= x + d < w:
+                    e0[c, x + d] += error * 2 / 4
+                if y + 1 < h:
+                    if 0 <= x - d < w:
+                        e1[c, x - d] += error * 1 / 4
+                    e1[c, x] += error * 1 / 4
+
+
+def sierra_lite_color_dither(image, palette, serpentine=False):
     """
     Apply Sierra Lite error diffusion dithering with a color palette.
 
     Args:
         image (PIL.Image): Input RGB image
-        palette (list): List of RGB tuples representing available colors
+        palette (list or np.ndarray): RGB tuples or an (n, 3) array of available colors
+        serpentine (bool): Scan alternate rows right to left (default: False).
 
     Returns:
-        PIL.Image: Dithered image using only palette colors
+        PIL.Image: Dithered image using only palette colors (mode 'P' for up to 256 colors)
     """
-    img = image.convert('RGB')
-    arr = np.array(img, dtype=float)
-    h, w, _ = arr.shape
+    arr = _to_planes(image)
+    palette = np.asarray(palette, dtype=np.float32)
+    out = _index_buffer(arr.shape[1:], len(palette))
+    _sierra_lite_kernel(arr, palette, _lut_for(palette), out, serpentine)
 
-    for y in range(h):
-        for x in range(w):
-            old_pixel = arr[y, x].copy()
-            new_pixel = np.array(find_closest_color(tuple(old_pixel.astype(int)), palette))
-            arr[y, x] = new_pixel
-            error = old_pixel - new_pixel
-
-            if x + 1 < w:
-                arr[y, x + 1] += error * 2 / 4
-            if y + 1 < h:
-                if x - 1 >= 0:
-                    arr[y + 1, x - 1] += error * 1 / 4
-                arr[y + 1, x] += error * 1 / 4
-
-    arr = np.clip(arr, 0, 255).astype(np.uint8)
-    return Image.fromarray(arr)
+    return _indexed_image(out, palette)
 
 
 def halftone_color_dither(image, palette, dot_size=4):
@@ -472,52 +1019,23 @@ def halftone_color_dither(image, palette, dot_size=4):
 
     Args:
         image (PIL.Image): Input RGB image
-        palette (list): List of RGB tuples representing available colors
+        palette (list or np.ndarray): RGB tuples or an (n, 3) array of available colors
         dot_size (int): Size of halftone cells in pixels (default: 4).
 
     Returns:
-        PIL.Image: Halftone dithered image using palette colors
+        PIL.Image: Halftone dithered image using palette colors (mode 'P' for up to 256 colors)
     """
-    img = image.convert('RGB')
-    arr = np.array(img, dtype=float)
+    img = ensure_mode(image, 'RGB')
+    arr = np.asarray(img)
     h, w, _ = arr.shape
 
-    # Sort palette by luminance
-    palette_sorted = sorted(palette, key=lambda c: 0.299*c[0] + 0.587*c[1] + 0.114*c[2])
-    n_colors = len(palette_sorted)
-
-    # Create coordinate grids for circle calculations
-    y_coords, x_coords = np.ogrid[:dot_size, :dot_size]
-    center = dot_size / 2
-
-    # Initialize output with lightest color
-    output = np.full((h, w, 3), palette_sorted[-1], dtype=np.uint8)
-
-    for y in range(0, h - dot_size + 1, dot_size):
-        for x in range(0, w - dot_size + 1, dot_size):
-            # Calculate average color in this cell
-            cell = arr[y:y + dot_size, x:x + dot_size]
-            avg_color = np.mean(cell, axis=(0, 1))
-            avg_luminance = (0.299 * avg_color[0] + 0.587 * avg_color[1] + 0.114 * avg_color[2]) / 255
+    # Palette sorted by luminance
+    palette_sorted = sort_palette(_palette_key(palette))
 
-            # Calculate dot radius based on luminance (darker = larger)
-            max_radius = dot_size / 2
-            radius = max_radius * (1 - avg_luminance)
+    output = _index_buffer((h, w), len(palette_sorted))
+    _apply_halftone(arr, len(palette_sorted), dot_size, output)
 
-            # Find closest dark color for the dot
-            dark_idx = int(np.clip((1 - avg_luminance) * n_colors, 0, n_colors - 1))
-            dot_color = palette_sorted[dark_idx]
-
-            # Create circular mask
-            distance = np.sqrt((x_coords - center + 0.5) ** 2 +
-                             (y_coords - center + 0.5) ** 2)
-            mask = distance <= radius
-
-            # Apply dot
-            for c in range(3):
-                output[y:y + dot_size, x:x + dot_size, c][mask] = dot_color[c]
-
-    return Image.fromarray(output)
+    return _indexed_image(output, palette_sorted)
 
 
 def blue_noise_color_dither(image, palette):
@@ -526,39 +1044,44 @@ def blue_noise_color_dither(image, palette):
 
     Args:
         image (PIL.Image): Input RGB image
-        palette (list): List of RGB tuples representing available colors
+        palette (list or np.ndarray): RGB tuples or an (n, 3) array of available colors
 
     Returns:
-        PIL.Image: Blue noise dithered image using palette colors
+        PIL.Image: Blue noise dithered image using palette colors (mode 'P' for up to 256 colors)
     """
-    from scipy.ndimage import gaussian_filter
-
-    img = image.convert('RGB')
-    arr = np.array(img, dtype=float)
+    img = ensure_mode(image, 'RGB')
+    arr = np.asarray(img)
     h, w, _ = arr.shape
 
-    # Sort palette by luminance
-    palette_sorted = sorted(palette, key=lambda c: 0.299*c[0] + 0.587*c[1] + 0.114*c[2])
-    n_colors = len(palette_sorted)
+    # Palette sorted by luminance
+    palette_sorted = sort_palette(_palette_key(palette))
 
-    # Generate blue noise map
-    np.random.seed(42)
-    noise = np.random.rand(64, 64)
-    noise = gaussian_filter(noise, sigma=1.5)
-    noise = (noise - noise.min()) / (noise.max() - noise.min())
+    output = _index_buffer((h, w), len(palette_sorted))
+    _apply_threshold(arr, get_blue_noise_map(), len(palette_sorted), output)
 
-    noise_h, noise_w = noise.shape
-    output = np.zeros((h, w, 3), dtype=np.uint8)
+    return _indexed_image(output, palette_sorted)
 
-    for y in range(h):
-        for x in range(w):
-            pixel = arr[y, x]
-            luminance = (0.299 * pixel[0] + 0.587 * pixel[1] + 0.114 * pixel[2]) / 255
-            threshold = noise[y % noise_h, x % noise_w]
 
-            # Adjust luminance by threshold and map to palette index
-            adjusted = luminance + (threshold - 0.5) / n_colors
-            palette_idx = int(np.clip(adjusted * n_colors, 0, n_colors - 1))
-            output[y, x] = palette_sorted[palette_idx]
+def _warmup():
+    """
+    Compile the Numba kernels ahead of the first request.
 
-    return Image.fromarray(output)
+    See dithering._warmup; the color kernels are warmed the same way with
+    a two-color palette.
+    """
+    palette = np.array([[0, 0, 0], [255, 255, 255]], dtype=np.float32)
+    planes = np.zeros((3, 2, 2), dtype=np.uint8)
+    for kernel in (_floyd_steinberg_kernel, _atkinson_kernel, _stucki_kernel, _jarvis_kernel,
+                   _burkes_kernel, _sierra_kernel, _sierra_two_row_kernel, _sierra_lite_kernel):
+        kernel(planes, palette, _NO_LUT, np.empty((2, 2), dtype=np.uint8), False)
+
+    arr = np.zeros((4, 4, 3), dtype=np.uint8)
+    arr.flags.writeable = False  # as returned by np.asarray() on a PIL image
+    for dtype in (np.uint8, np.uint16):
+        output = np.empty((4, 4), dtype=dtype)
+        _threshold_kernel(arr, np.zeros((4, 4)), 2, output)
+        _halftone_kernel(arr, 2, 4, output)
+
+
+if HAVE_NUMBA:
+    _warmup()
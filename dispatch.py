@@ -0,0 +1,102 @@
+"""
+Algorithm dispatch tables shared by the web and API endpoints.
+
+Maps the public algorithm names accepted by /dither and /api/dither to
+the B&W and color dithering functions, built once at import.
+"""
+
+from PIL import Image
+
+from jit import HAVE_NUMBA
+from palettes import PALETTES, get_palette_array
+
+from dithering import (
+    floyd_steinberg_dither, ordered_dither, atkinson_dither, bayer_dither,
+    stucki_dither, jarvis_dither, burkes_dither,
+    sierra_dither, sierra_two_row_dither, sierra_lite_dither,
+    halftone_dither, blue_noise_dither
+)
+from color_dithering import (
+    floyd_steinberg_color_dither, ordered_color_dither,
+    atkinson_color_dither, bayer_color_dither,
+    stucki_color_dither, jarvis_color_dither, burkes_color_dither,
+    sierra_color_dither, sierra_two_row_color_dither, sierra_lite_color_dither,
+    halftone_color_dither, blue_noise_color_dither
+)
+
+
+# Algorithm mappings for cleaner routing
+BW_ALGORITHMS = {
+    'floyd-steinberg': floyd_steinberg_dither,
+    'ordered': ordered_dither,
+    'atkinson': atkinson_dither,
+    'bayer': bayer_dither,
+    'stucki': stucki_dither,
+    'jarvis': jarvis_dither,
+    'burkes': burkes_dither,
+    'sierra': sierra_dither,
+    'sierra-two-row': sierra_two_row_dither,
+    'sierra-lite': sierra_lite_dither,
+    'halftone': halftone_dither,
+    'blue-noise': blue_noise_dither
+}
+
+COLOR_ALGORITHMS = {
+    'floyd-steinberg': floyd_steinberg_color_dither,
+    'ordered': ordered_color_dither,
+    'atkinson': atkinson_color_dither,
+    'bayer': bayer_color_dither,
+    'stucki': stucki_color_dither,
+    'jarvis': jarvis_color_dither,
+    'burkes': burkes_color_dither,
+    'sierra': sierra_color_dither,
+    'sierra-two-row': sierra_two_row_color_dither,
+    'sierra-lite': sierra_lite_color_dither,
+    'halftone': halftone_color_dither,
+    'blue-noise': blue_noise_color_dither
+}
+
+
+def resolve(algorithm, use_color):
+    """
+    Look up the dithering function for an algorithm name.
+
+    Args:
+        algorithm (str): Public algorithm name, e.g. 'floyd-steinberg'.
+        use_color (bool): Select the palette-aware color variant instead of B&W.
+
+    Returns:
+        callable or None: The dithering function, or None if the name is unknown.
+            Color functions take (image, palette); B&W functions take (image).
+    """
+    return (COLOR_ALGORITHMS if use_color else BW_ALGORITHMS).get(algorithm)
+
+
+def warmup(palette_ids=()):
+    """
+    Run every dithering function once on a tiny image.
+
+    The kernel modules compile their Numba kernels at import, and every
+    palette shares them. Going through the public functions with a
+    two-color palette also prepares what the first B&W or generic color
+    request would otherwise set up, such as the blue noise map. Built-in
+    palettes of more than 8 colors also use a lookup table, which takes
+    up to about 0.1 s to build. Deployments can name the palettes to build
+    tables for now instead of on first use. Does nothing when Numba is
+    not installed.
+
+    Args:
+        palette_ids (iterable of str): Built-in palette IDs to build lookup
+            tables for. Unknown IDs are ignored.
+    """
+    if not HAVE_NUMBA:
+        return
+
+    img = Image.new('RGB', (8, 8))
+    for func in BW_ALGORITHMS.values():
+        func(img)
+    palettes = [get_palette_array('bw')]
+    palettes += [get_palette_array(pid) for pid in palette_ids if pid in PALETTES]
+    for palette in palettes:
+        for func in COLOR_ALGORITHMS.values():
+            func(img, palette)
@@ -0,0 +1,37 @@
+"""
+Optional Numba acceleration for the dithering kernels.
+
+The per-pixel loops in dithering.py and color_dithering.py are written as
+plain Python over NumPy arrays so that Numba can compile them to native
+code. Numba is an optional dependency: when it is not installed the
+decorators below fall back to no-ops and the same loops run in the
+interpreter, just much more slowly.
+"""
+
+import threading
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+# The sequential error diffusion kernels are compiled with nogil=True, so
+# Flask's threaded server can run several of them at once on separate cores.
+#
+# Numba's fallback "workqueue" threading layer aborts the process when two
+# Python threads launch parallel=True kernels at the same time, which is
+# exactly what Flask's threaded server does. Parallel kernels already use
+# every core, so callers simply launch them one at a time under this lock.
+PARALLEL_LOCK = threading.Lock()
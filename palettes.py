@@ -5,6 +5,11 @@ Each palette is a list of RGB tuples representing the available colors
 for the dithering algorithm to map pixels to.
 """
 
+import json
+from functools import lru_cache
+
+import numpy as np
+
 PALETTES = {
     'bw': [
         (0, 0, 0),       # Black
@@ -112,8 +117,9 @@ def get_palette(name):
     """Get palette by name, returns B&W if not found."""
     return PALETTES.get(name, PALETTES['bw'])
 
+@lru_cache(maxsize=1)
 def get_palette_list():
-    """Get list of all available palettes with metadata."""
+    """Get list of all available palettes with metadata, built once and shared (do not modify)."""
     return [
         {
             'id': pid,
@@ -122,3 +128,33 @@ def get_palette_list():
         }
         for pid in PALETTES.keys()
     ]
+
+
+@lru_cache(maxsize=64)
+def get_palette_array(name):
+    """Get palette by name as a read-only (n, 3) uint8 array, cached per name."""
+    arr = np.asarray(get_palette(name), dtype=np.uint8)
+    arr.flags.writeable = False
+    return arr
+
+
+@lru_cache(maxsize=64)
+def parse_custom_palette(palette_json):
+    """Parse a JSON list of [r, g, b] colors into a read-only (n, 3) uint8 array, cached per string."""
+    message = 'Custom palette must be a non-empty list of [r, g, b] colors in 0-255'
+    colors = json.loads(palette_json)
+    # Only plain integers; the array cast would silently truncate floats and accept booleans
+    if not isinstance(colors, list) or not colors or not all(
+            isinstance(color, list) and len(color) == 3
+            and all(isinstance(v, int) and not isinstance(v, bool) for v in color)
+            for color in colors):
+        raise ValueError(message)
+    try:
+        arr = np.asarray(colors, dtype=np.int64)
+    except OverflowError:
+        raise ValueError(message) from None
+    if arr.min() < 0 or arr.max() > 255:
+        raise ValueError(message)
+    arr = arr.astype(np.uint8)
+    arr.flags.writeable = False
+    return arr
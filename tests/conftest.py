@@ -0,0 +1,13 @@
+import pytest
+
+import utils
+from app import app
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Flask test client backed by a fresh, empty result cache."""
+    monkeypatch.setattr(utils, 'RESULT_CACHE', utils.ResultCache())
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
@@ -0,0 +1,78 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+ENDPOINTS = ['/dither', '/api/dither']
+
+
+def encode(img, format, **params):
+    """Encode a PIL image to bytes in the given format."""
+    output = io.BytesIO()
+    img.save(output, format=format, **params)
+    return output.getvalue()
+
+
+def gradient(mode='RGB', size=(40, 30)):
+    """Small test image with varying colors, converted to the given mode."""
+    w, h = size
+    x, y = np.meshgrid(np.arange(w), np.arange(h))
+    arr = np.stack([x * 255 // w, y * 255 // h, (x + y) * 4 % 256], axis=-1)
+    return Image.fromarray(arr.astype(np.uint8)).convert(mode)
+
+
+PNG = encode(gradient(), 'PNG')
+
+
+def post(client, endpoint, body, filename='upload.png', **form):
+    """POST an upload with the given form fields and return the response."""
+    form['file'] = (io.BytesIO(body), filename)
+    return client.post(endpoint, data=form, content_type='multipart/form-data')
+
+
+@pytest.mark.parametrize('endpoint', ENDPOINTS)
+@pytest.mark.parametrize('form, error', [
+    ({'algorithm': 'no-such-algorithm'}, 'Invalid algorithm'),
+    ({'palette': 'no-such-palette'}, 'Invalid palette'),
+    ({'max_dimension': 'abc'}, 'Invalid max_dimension'),
+])
+def test_unknown_parameters_are_rejected(client, endpoint, form, error):
+    """Unknown algorithm and palette names and bad max_dimension values are client errors."""
+    response = post(client, endpoint, PNG, **form)
+
+    assert response.status_code == 400
+    assert response.get_json() == {'error': error}
+
+
+@pytest.mark.parametrize('endpoint', ENDPOINTS)
+@pytest.mark.parametrize('body', [
+    encode(gradient(), 'BMP'),
+    PNG[:len(PNG) // 2],
+    b'this is not an image',
+], ids=['bmp', 'truncated', 'not-an-image'])
+def test_bad_uploads_are_rejected(client, endpoint, body):
+    """Disallowed formats and undecodable files are 400s, not server errors."""
+    response = post(client, endpoint, body)
+
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+@pytest.mark.parametrize('endpoint', ENDPOINTS)
+@pytest.mark.parametrize('body', [
+    encode(gradient('P'), 'GIF'),
+    encode(gradient('RGBA'), 'PNG'),
+    encode(gradient('CMYK'), 'JPEG'),
+], ids=['gif-p', 'png-rgba', 'jpeg-cmyk'])
+@pytest.mark.parametrize('palette, mode', [('bw', '1'), ('gameboy', 'P')])
+def test_uploads_in_any_mode_are_dithered(client, endpoint, body, palette, mode):
+    """B&W results are 1-bit PNGs, color results paletted PNGs."""
+    response = post(client, endpoint, body, palette=palette)
+
+    assert response.status_code == 200
+    assert response.mimetype == 'image/png'
+    result = Image.open(io.BytesIO(response.data))
+    assert result.format == 'PNG'
+    assert result.mode == mode
+    assert result.size == (40, 30)
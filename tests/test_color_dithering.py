@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from color_dithering import _closest_index, _lut_index, _to_planes, build_palette_lut, palette_lut
+from palettes import PALETTES
+
+
+def nearest(r, g, b, palette, lut):
+    """Nearest palette index the way the error diffusion kernels compute it."""
+    i = _lut_index(r, g, b, lut)
+    if i < 0:
+        i = _closest_index(r, g, b, palette)
+    return i
+
+
+@pytest.mark.parametrize('palette_id', sorted(PALETTES))
+def test_palette_lut_matches_closest_index(palette_id):
+    """The lookup table path picks the same color as the full search."""
+    palette = np.asarray(PALETTES[palette_id], dtype=np.float32)
+    lut = palette_lut(tuple(PALETTES[palette_id]))
+    rng = np.random.default_rng(0)
+
+    # In range, plus values pushed outside 0-255 by accumulated error
+    values = np.concatenate([
+        rng.uniform(0, 256, size=(5000, 3)),
+        rng.uniform(-200, 456, size=(5000, 3)),
+        [[-0.5, 0, 0], [255.5, 255, 255], [256, 0, 0], [-1, 300, 128]],
+    ]).astype(np.float32)
+
+    for r, g, b in values:
+        assert nearest(r, g, b, palette, lut) == _closest_index(r, g, b, palette)
+
+
+def test_palette_lut_entries_are_exact():
+    """Every value in a block the table claims is nearest to that block's color."""
+    palette = np.asarray(PALETTES['nes'], dtype=np.float32)
+    lut = build_palette_lut(palette)
+    owned = np.argwhere(lut >= 0)
+    rng = np.random.default_rng(1)
+
+    for r, g, b in owned[rng.choice(len(owned), size=200, replace=False)]:
+        for dr, dg, db in rng.integers(0, 8, size=(8, 3)):
+            value = (r * 8 + dr, g * 8 + dg, b * 8 + db)
+            assert lut[r, g, b] == _closest_index(*value, palette)
+
+
+@pytest.mark.parametrize('size', [(1, 1), (1, 5), (7, 3)])
+def test_to_planes_is_writable_and_contiguous(size):
+    """Planes always match the kernels' warmed signature, even for 1-pixel images."""
+    img = Image.new('RGB', size, (10, 20, 30))
+
+    planes = _to_planes(img)
+
+    assert planes.shape == (3, size[1], size[0])
+    assert planes.dtype == np.uint8
+    assert planes.flags.c_contiguous
+    assert planes.flags.writeable
+    np.testing.assert_array_equal(planes[:, 0, 0], [10, 20, 30])
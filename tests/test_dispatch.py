@@ -0,0 +1,30 @@
+import pytest
+
+from dispatch import BW_ALGORITHMS, COLOR_ALGORITHMS, resolve
+
+ALGORITHM_NAMES = [
+    'floyd-steinberg', 'ordered', 'atkinson', 'bayer', 'stucki', 'jarvis', 'burkes',
+    'sierra', 'sierra-two-row', 'sierra-lite', 'halftone', 'blue-noise',
+]
+
+
+def test_tables_cover_the_same_names():
+    """Every public algorithm has both a B&W and a color variant."""
+    assert set(BW_ALGORITHMS) == set(COLOR_ALGORITHMS) == set(ALGORITHM_NAMES)
+
+
+@pytest.mark.parametrize('name', ALGORITHM_NAMES)
+def test_resolve_known_names(name):
+    """Known names map to the matching function in each table."""
+    assert callable(resolve(name, False))
+    assert callable(resolve(name, True))
+    assert resolve(name, False) is BW_ALGORITHMS[name]
+    assert resolve(name, True) is COLOR_ALGORITHMS[name]
+    assert resolve(name, False) is not resolve(name, True)
+
+
+@pytest.mark.parametrize('name', ['', 'unknown', 'Floyd-Steinberg', 'floyd_steinberg', None])
+def test_resolve_unknown_names(name):
+    """Unknown names return None for both variants."""
+    assert resolve(name, False) is None
+    assert resolve(name, True) is None
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from dithering import (_pixel_thresholds, blue_noise_dither, floyd_steinberg_dither,
+                       get_blue_noise_map, get_blue_noise_pixel_thresholds)
+
+
+def reference_floyd_steinberg(image):
+    """The original pure Python Floyd-Steinberg loop the kernel must reproduce."""
+    arr = np.array(image.convert('L'), dtype=float)
+    h, w = arr.shape
+
+    for y in range(h):
+        for x in range(w):
+            old_pixel = arr[y, x]
+            new_pixel = 255 if old_pixel > 127 else 0
+            arr[y, x] = new_pixel
+            error = old_pixel - new_pixel
+
+            if x + 1 < w:
+                arr[y, x + 1] += error * 7 / 16
+            if y + 1 < h:
+                if x > 0:
+                    arr[y + 1, x - 1] += error * 3 / 16
+                arr[y + 1, x] += error * 5 / 16
+                if x + 1 < w:
+                    arr[y + 1, x + 1] += error * 1 / 16
+
+    return arr.astype(np.uint8)
+
+
+@pytest.mark.parametrize('size, low, high', [((60, 40), 0, 256), ((71, 33), 100, 160),
+                                             ((1, 1), 127, 128), ((5, 1), 0, 256)])
+def test_floyd_steinberg_matches_reference(size, low, high):
+    """The compiled kernel is bit-identical to the original loop."""
+    w, h = size
+    arr = np.random.default_rng(0).integers(low, high, (h, w), dtype=np.uint8)
+    img = Image.fromarray(arr)
+
+    result = floyd_steinberg_dither(img)
+
+    assert result.mode == 'L'
+    np.testing.assert_array_equal(np.asarray(result), reference_floyd_steinberg(img))
+
+
+def test_floyd_steinberg_serpentine_mirrors_odd_rows():
+    """With serpentine, an odd row is dithered as its mirror image scanned left to right."""
+    row = np.random.default_rng(1).integers(0, 256, 50, dtype=np.uint8)
+    img = Image.fromarray(np.stack([np.zeros(50, dtype=np.uint8), row]))
+    mirrored = Image.fromarray(np.stack([np.zeros(50, dtype=np.uint8), row[::-1]]))
+
+    result = np.asarray(floyd_steinberg_dither(img, serpentine=True))
+    expected = np.asarray(floyd_steinberg_dither(mirrored))
+
+    np.testing.assert_array_equal(result[1], expected[1][::-1])
+    assert (result[1] != np.asarray(floyd_steinberg_dither(img))[1]).any()
+
+
+def test_blue_noise_thresholds_are_cached():
+    """Blue noise reuses one set of pixel thresholds derived from the shared map."""
+    thresholds = get_blue_noise_pixel_thresholds()
+    arr = np.random.default_rng(2).integers(0, 256, (64, 64), dtype=np.uint8)
+
+    assert get_blue_noise_pixel_thresholds() is thresholds
+    np.testing.assert_array_equal(thresholds, _pixel_thresholds(get_blue_noise_map()))
+    np.testing.assert_array_equal(np.asarray(blue_noise_dither(Image.fromarray(arr))),
+                                  np.where(arr / 255 > get_blue_noise_map(), 255, 0))
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from palettes import parse_custom_palette
+
+
+def test_parse_custom_palette():
+    """A valid palette becomes a read-only (n, 3) uint8 array."""
+    arr = parse_custom_palette('[[255, 0, 0], [0, 128, 255]]')
+
+    np.testing.assert_array_equal(arr, [[255, 0, 0], [0, 128, 255]])
+    assert arr.dtype == np.uint8
+    assert not arr.flags.writeable
+
+
+@pytest.mark.parametrize('palette_json', [
+    '[[1.9, 0, 0]]',
+    '[[true, false, true]]',
+    '[[255, 0, 0], [0, true, 0]]',
+    '[]',
+    '{"r": 255, "g": 0, "b": 0}',
+    '"red"',
+    '[255, 0, 0]',
+    '[[255, 0]]',
+    '[[255, 0, 0, 0]]',
+    '[[NaN, 0, 0]]',
+    '[[null, 0, 0]]',
+    '[[256, 0, 0]]',
+    '[[-1, 0, 0]]',
+    '[[100000000000000000000, 0, 0]]',
+])
+def test_parse_custom_palette_rejects_invalid(palette_json):
+    """Anything but a non-empty list of [r, g, b] integers in 0-255 is rejected."""
+    with pytest.raises(ValueError, match='Custom palette must be'):
+        parse_custom_palette(palette_json)
@@ -0,0 +1,93 @@
+import io
+
+import pytest
+from PIL import Image
+
+import utils
+from utils import ResultCache, parse_max_dimension
+
+
+def test_result_cache_defaults():
+    """The shared cache holds up to 128 results and 64 MB."""
+    cache = ResultCache()
+
+    assert cache.max_entries == 128
+    assert cache.max_bytes == 64 * 1024 * 1024
+
+
+def test_result_cache_evicts_least_recently_used():
+    """Past the entry limit the entry used longest ago goes first."""
+    cache = ResultCache(max_entries=2)
+    cache.put('a', b'1')
+    cache.put('b', b'2')
+    assert cache.get('a') == b'1'  # 'b' is now the least recently used
+
+    cache.put('c', b'3')
+
+    assert cache.get('b') is None
+    assert cache.get('a') == b'1'
+    assert cache.get('c') == b'3'
+
+
+def test_result_cache_byte_cap():
+    """Entries are evicted to stay under max_bytes; oversized results are not stored."""
+    cache = ResultCache(max_bytes=10)
+    cache.put('a', b'x' * 4)
+    cache.put('b', b'x' * 4)
+    cache.put('c', b'x' * 4)
+
+    assert cache.get('a') is None
+    assert cache.get('b') is not None
+    assert cache.get('c') is not None
+
+    cache.put('big', b'x' * 11)
+
+    assert cache.get('big') is None
+    assert cache.get('b') is not None
+
+
+def test_result_cache_replaces_existing_key():
+    """Storing a key again replaces its value without double counting its size."""
+    cache = ResultCache(max_bytes=10)
+    cache.put('a', b'x' * 8)
+    cache.put('a', b'y' * 8)
+    cache.put('b', b'z' * 2)
+
+    assert cache.get('a') == b'y' * 8
+    assert cache.get('b') == b'z' * 2
+
+
+@pytest.mark.parametrize('first, second', [('/dither', '/api/dither'),
+                                           ('/api/dither', '/dither')])
+def test_repeat_request_is_served_from_cache(client, first, second):
+    """A repeat upload is answered from the cache, whichever endpoint it arrives at."""
+    output = io.BytesIO()
+    Image.effect_noise((48, 32), 64).save(output, format='PNG')
+    body = output.getvalue()
+    form = {'algorithm': 'atkinson', 'palette': 'gameboy', 'max_dimension': '32'}
+    key = ResultCache.make_key(body, 'atkinson', 'gameboy', None, 32)
+
+    response = client.post(first, data={**form, 'file': (io.BytesIO(body), 'a.png')})
+    assert response.status_code == 200
+    assert utils.RESULT_CACHE.get(key) == response.data
+
+    # Swap in a marker so the second response can only have come from the cache
+    utils.RESULT_CACHE.put(key, b'cached')
+    response = client.post(second, data={**form, 'file': (io.BytesIO(body), 'b.png')})
+
+    assert response.status_code == 200
+    assert response.data == b'cached'
+
+
+@pytest.mark.parametrize('value, expected', [(None, 0), ('', 0), ('0', 0), ('512', 512)])
+def test_parse_max_dimension(value, expected):
+    """Missing and empty values disable downscaling."""
+    assert parse_max_dimension(value) == expected
+
+
+@pytest.mark.parametrize('value', ['abc', '1.5', '-1', '1e3'])
+def test_parse_max_dimension_rejects_invalid(value):
+    """Anything but a non-negative integer gets a fixed client message."""
+    with pytest.raises(ValueError) as excinfo:
+        parse_max_dimension(value)
+    assert str(excinfo.value) == 'Invalid max_dimension'
@@ -0,0 +1,217 @@
+"""
+Helpers shared by the web (app.py) and public API (api.py) endpoints.
+"""
+
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+from PIL import Image, UnidentifiedImageError
+
+from dispatch import resolve
+from palettes import PALETTES, get_palette_array, parse_custom_palette
+
+# Formats accepted for upload, as reported by PIL's Image.format. Pillow
+# reports JPEGs carrying an MPF segment (common from phones and cameras) as MPO
+ALLOWED_FORMATS = {'PNG', 'JPEG', 'MPO', 'GIF', 'WEBP'}
+
+
+def allowed_image(img):
+    """
+    Check if an opened image was decoded from an allowed format.
+
+    The format comes from the file contents rather than the filename,
+    so mislabeled uploads are judged by what they actually are.
+
+    Args:
+        img (PIL.Image): Image returned by Image.open().
+
+    Returns:
+        bool: True if the image format is in ALLOWED_FORMATS, False otherwise.
+    """
+    return img.format in ALLOWED_FORMATS
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache of encoded dithering results.
+
+    Repeat requests for the same upload and settings (common while tweaking
+    options in the UI) are answered from memory instead of re-running the
+    decode, dither and encode pipeline. Entries are evicted least recently
+    used first once either the entry count or the total byte size is exceeded.
+
+    Args:
+        max_entries (int): Maximum number of cached results.
+        max_bytes (int): Maximum combined size of the cached results.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(body, *params):
+        """
+        Build a cache key from the uploaded bytes and the request parameters.
+
+        Args:
+            body (bytes): Raw uploaded file contents.
+            *params: Every request parameter that affects the output.
+
+        Returns:
+            tuple: Hashable key of the upload's SHA-256 digest and the parameters.
+        """
+        return (hashlib.sha256(body).digest(),) + params
+
+    def get(self, key):
+        """Return the cached result for key, or None on a miss."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """Store a result, evicting old entries to stay within the limits."""
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = value
+            self._size += len(value)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+
+# Shared by both endpoints, so the web UI and the API reuse each other's results
+RESULT_CACHE = ResultCache()
+
+
+def parse_max_dimension(value):
+    """
+    Parse the max_dimension form field.
+
+    Args:
+        value (str or None): Raw form value; missing or empty means no limit.
+
+    Returns:
+        int: The maximum side length, or 0 to disable downscaling.
+
+    Raises:
+        ValueError: The value is not a non-negative integer. The message is meant
+            for the client.
+    """
+    if not value:
+        return 0
+    try:
+        max_dimension = int(value)
+    except ValueError:
+        raise ValueError('Invalid max_dimension') from None
+    if max_dimension < 0:
+        raise ValueError('Invalid max_dimension')
+    return max_dimension
+
+
+class DisallowedImageError(ValueError):
+    """Raised by render_png when an upload decodes to a format outside ALLOWED_FORMATS."""
+
+
+def render_png(body, algorithm, palette_id, custom_palette, max_dimension):
+    """
+    Dither an uploaded image and encode the result as PNG.
+
+    This is the whole pipeline behind /dither and /api/dither; the endpoints
+    only read the form and shape the response. Parameters are validated
+    before the image is decoded, and results are served from RESULT_CACHE
+    when the same upload arrives with the same settings.
+
+    Args:
+        body (bytes): Raw uploaded file contents.
+        algorithm (str): Public algorithm name, e.g. 'floyd-steinberg'.
+        palette_id (str): Built-in palette ID; 'bw' selects the B&W dithers.
+        custom_palette (str or None): JSON list of [r, g, b] colors, used instead of palette_id.
+        max_dimension (int): Downscale so neither side exceeds this before dithering; 0 disables.
+
+    Returns:
+        bytes: The encoded PNG.
+
+    Raises:
+        DisallowedImageError: The upload is an image in a format that is not allowed.
+        ValueError: Invalid parameters, or an image that cannot be decoded or is too
+            large. The message is meant for the client.
+    """
+    if not custom_palette and palette_id not in PALETTES:
+        raise ValueError('Invalid palette')
+
+    # Use color dithering if not B&W palette
+    use_color = palette_id != 'bw' or custom_palette
+
+    # Resolve the algorithm; B&W keeps the original grayscale functions
+    dither_func = resolve(algorithm, use_color)
+    if dither_func is None:
+        raise ValueError('Invalid algorithm')
+
+    # Get palette colors as a cached (n, 3) array
+    if custom_palette:
+        palette = parse_custom_palette(custom_palette)
+    else:
+        palette = get_palette_array(palette_id)
+
+    # Identical uploads with identical settings reuse the encoded result
+    cache_key = RESULT_CACHE.make_key(body, algorithm, palette_id, custom_palette, max_dimension)
+    png = RESULT_CACHE.get(cache_key)
+    if png is not None:
+        return png
+
+    try:
+        img = Image.open(io.BytesIO(body))
+    except UnidentifiedImageError:
+        raise ValueError('Invalid or corrupted image file') from None
+    except Image.DecompressionBombError:
+        raise ValueError('Image dimensions too large') from None
+    if not allowed_image(img):
+        raise DisallowedImageError(img.format)
+
+    # Color dithers work in RGB, B&W dithers in grayscale. Converting
+    # straight to the mode the dither needs skips a full-image copy, and
+    # none at all when the upload is already in that mode (e.g. JPEG)
+    mode = 'RGB' if use_color else 'L'
+    if max_dimension > 0:
+        img.draft(mode, (max_dimension, max_dimension))  # JPEG-only DCT downscale
+
+    # Image.open only reads the header; decode now so a truncated or
+    # damaged file is reported as a bad upload rather than a server error
+    try:
+        img.load()
+    except OSError:
+        raise ValueError('Invalid or corrupted image file') from None
+
+    if img.mode != mode:
+        img = img.convert(mode)
+
+    # Optional preview path: shrink oversized images before dithering
+    if max_dimension > 0 and max(img.size) > max_dimension:
+        img.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+
+    if use_color:
+        dithered = dither_func(img, palette)
+    else:
+        # B&W results only hold 0 and 255, so a 1-bit image loses
+        # nothing and gives the PNG encoder an eighth of the bytes
+        dithered = dither_func(img).convert('1', dither=Image.Dither.NONE)
+
+    # zlib level 1 encodes several times faster than the default level 6
+    # for a modest size increase; dithered output compresses well anyway
+    output = io.BytesIO()
+    dithered.save(output, format='PNG', compress_level=1)
+    png = output.getvalue()
+    RESULT_CACHE.put(cache_key, png)
+    return png